@@ -37,6 +37,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "pygame>=2.6.0",
+        "numpy>=1.21.0",
     ],
     entry_points={
         "console_scripts": [
@@ -9,6 +9,8 @@ from tetris import (
     COLORS,
     GRID_HEIGHT,
     GRID_WIDTH,
+    PIECE_KICKS,
+    PIECE_OFFSETS,
     SHAPES,
     GameConfig,
     GameOverState,
@@ -28,7 +30,8 @@ class TestTetromino:
         piece = Tetromino("I")
         assert piece.type == "I"
         assert piece.color == COLORS["I"]
-        assert len(piece.shape) > 0
+        assert piece.rot == 0
+        assert len(piece.get_blocks()) == 4
 
     def test_all_shapes_exist(self):
         """Test that all 7 tetromino shapes can be created"""
@@ -40,18 +43,54 @@ class TestTetromino:
     def test_tetromino_rotation_clockwise(self):
         """Test clockwise rotation"""
         piece = Tetromino("T")
-        original_shape = [row[:] for row in piece.shape]
+        original_blocks = piece.get_blocks()
         piece.rotate_clockwise()
-        # Shape should change after rotation
-        assert piece.shape != original_shape
+        # Blocks should change after rotation
+        assert piece.rot == 1
+        assert piece.get_blocks() != original_blocks
 
     def test_tetromino_rotation_counterclockwise(self):
         """Test counterclockwise rotation"""
         piece = Tetromino("T")
-        original_shape = [row[:] for row in piece.shape]
+        original_blocks = piece.get_blocks()
         piece.rotate_counterclockwise()
-        # Shape should change after rotation
-        assert piece.shape != original_shape
+        # Blocks should change after rotation
+        assert piece.rot == 3
+        assert piece.get_blocks() != original_blocks
+
+    def test_rotation_round_trip(self):
+        """Test four rotations or a clockwise/counterclockwise pair restore the piece"""
+        for shape_type in SHAPES:
+            piece = Tetromino(shape_type)
+            original_blocks = piece.get_blocks()
+            piece.rotate_clockwise()
+            piece.rotate_counterclockwise()
+            assert piece.get_blocks() == original_blocks
+            for _ in range(4):
+                piece.rotate_clockwise()
+            assert piece.get_blocks() == original_blocks
+
+    def test_tall_shape_rotates_about_box_center(self):
+        """Test a shape taller than wide is centered horizontally in its rotation box"""
+
+        class CustomConfig(GameConfig):  # pylint: disable=too-few-public-methods
+            """Custom configuration for testing with a vertical bar"""
+
+            SHAPES = {"V": [[1], [1], [1]]}
+            COLORS = {"V": (255, 255, 255)}
+
+        piece = Tetromino("V", CustomConfig)
+        base_x, base_y = piece.x, piece.y
+        assert piece.get_blocks() == [(base_x + 1, base_y + dy) for dy in range(3)]
+        piece.rotate_clockwise()
+        assert piece.get_blocks() == [(base_x + dx, base_y + 1) for dx in range(3)]
+
+    def test_piece_offsets_precomputed(self):
+        """Test every piece has four rotation states of four blocks each"""
+        for shape_type in SHAPES:
+            assert len(PIECE_OFFSETS[shape_type]) == 4
+            for offsets in PIECE_OFFSETS[shape_type]:
+                assert len(offsets) == 4
 
     def test_tetromino_copy(self):
         """Test copying a tetromino"""
@@ -63,11 +102,17 @@ class TestTetromino:
         assert copy.type == piece.type
         assert copy.x == piece.x
         assert copy.y == piece.y
-        assert copy.shape == piece.shape
+        assert copy.rot == piece.rot
         # Ensure it's a deep copy
         copy.x = 10
         assert piece.x == 5
 
+    def test_tetromino_uses_slots(self):
+        """Test pieces have no per-instance __dict__"""
+        piece = Tetromino("L")
+        assert not hasattr(piece, "__dict__")
+        assert piece.copy().color == COLORS["L"]
+
     def test_get_blocks(self):
         """Test getting block positions"""
         piece = Tetromino("O")
@@ -110,6 +155,13 @@ class TestTetrisGame:
         assert game.current_piece != old_piece
         assert game.current_piece is not None
 
+    def test_random_pieces_come_in_bags_of_seven(self, game):
+        """Test every piece type is dealt exactly once per bag"""
+        game._bag = []
+        for _ in range(2):
+            bag = [game.get_random_piece().type for _ in range(len(SHAPES))]
+            assert sorted(bag) == sorted(SHAPES)
+
     def test_is_valid_position(self, game):
         """Test position validation"""
         # Current piece at start should be valid
@@ -127,6 +179,32 @@ class TestTetrisGame:
         piece.y = GRID_HEIGHT  # Bottom boundary
         assert not game.is_valid_position(piece)
 
+    def test_is_valid_position_detects_placed_blocks(self, game):
+        """Test collision with blocks already locked into the grid"""
+        piece = Tetromino("O")
+        piece.x = 4
+        piece.y = GRID_HEIGHT - 2
+        assert game.is_valid_position(piece)
+
+        game.place_block(5, GRID_HEIGHT - 1, "I")
+        assert not game.is_valid_position(piece)
+        assert game.is_valid_position(piece, -2, 0)
+
+        # Cells above the top of the grid never collide
+        piece.y = -1
+        assert game.is_valid_position(piece)
+
+    def test_grid_bits_follow_line_clear(self, game):
+        """Test occupancy bits shift down together with the grid"""
+        for x in range(GRID_WIDTH):
+            game.place_block(x, GRID_HEIGHT - 1, "I")
+        game.place_block(0, GRID_HEIGHT - 2, "T")
+
+        game.clear_lines()
+        game.finish_clearing_animation()
+
+        assert game.grid_bits == 1 << ((GRID_HEIGHT - 1) * GRID_WIDTH)
+
     def test_move_piece(self, game):
         """Test moving pieces"""
         original_x = game.current_piece.x
@@ -152,6 +230,56 @@ class TestTetrisGame:
             # For most pieces, rotation changes shape
             pass  # Shape might be same if rotation failed due to collision
 
+    def test_rotate_piece_kicks_off_wall(self, game):
+        """Test rotating a vertical I against the right wall kicks it left (SRS R->2)"""
+        game.current_piece = Tetromino("I")
+        game.rotate_piece()
+        game.current_piece.x = GRID_WIDTH - 3
+        assert max(x for x, _ in game.current_piece.get_blocks()) == GRID_WIDTH - 1
+
+        game.rotate_piece()
+
+        assert game.current_piece.rot == 2
+        assert game.current_piece.x == GRID_WIDTH - 4
+        assert max(x for x, _ in game.current_piece.get_blocks()) == GRID_WIDTH - 1
+
+    def test_rotate_piece_at_left_wall(self, game):
+        """Test pieces whose box hangs past the left wall still collide correctly"""
+        game.current_piece = Tetromino("I")
+        game.rotate_piece()
+        while game.move_piece(-1, 0):
+            pass
+
+        assert game.current_piece.x == -2
+        assert min(x for x, _ in game.current_piece.get_blocks()) == 0
+        game.rotate_piece()
+        assert min(x for x, _ in game.current_piece.get_blocks()) == 0
+
+    def test_failed_rotation_restores_orientation(self, game):
+        """Test a rotation blocked in every kick position is undone"""
+        game.current_piece = Tetromino("I")
+        game.current_piece.y = 5
+        original_blocks = game.current_piece.get_blocks()
+        for x in range(GRID_WIDTH):
+            for y in range(GRID_HEIGHT):
+                if (x, y) not in original_blocks:
+                    game.place_block(x, y, "O")
+
+        game.rotate_piece()
+
+        assert game.current_piece.rot == 0
+        assert game.current_piece.get_blocks() == original_blocks
+
+    def test_kick_tables_cover_clockwise_rotations(self):
+        """Test every piece has kicks for each clockwise rotation, starting in place"""
+        for shape_type in SHAPES:
+            for rot in range(4):
+                kicks = PIECE_KICKS[shape_type][rot][(rot + 1) & 3]
+                assert kicks[0] == (0, 0)
+        assert PIECE_KICKS["O"][0][1] == ((0, 0),)
+        # SRS lists 0->R for J/L/S/T/Z as (-1, +1) with y up; on the grid y points down
+        assert PIECE_KICKS["T"][0][1][2] == (-1, -1)
+
     def test_ghost_piece(self, game):
         """Test ghost piece calculation"""
         ghost = game.get_ghost_piece()
@@ -159,11 +287,47 @@ class TestTetrisGame:
         assert ghost.y >= game.current_piece.y
         assert ghost.x == game.current_piece.x
 
+    def test_hard_drop_lands_on_stack(self, game):
+        """Test hard drop stops on top of the highest block below the piece"""
+        game.current_piece = Tetromino("O")
+        game.current_piece.x = 0
+        game.place_block(1, GRID_HEIGHT - 3, "I")
+        game.hard_drop()
+
+        assert game.grid[GRID_HEIGHT - 4][0] == game.piece_ids["O"]
+        assert game.grid[GRID_HEIGHT - 5][1] == game.piece_ids["O"]
+        assert game.heights[0] == GRID_HEIGHT - 5
+        assert game.heights[1] == GRID_HEIGHT - 5
+
+    def test_drop_distance_under_overhang(self, game):
+        """Test a piece tucked under an overhang still drops to the floor"""
+        game.place_block(0, GRID_HEIGHT - 4, "I")
+        piece = Tetromino("O")
+        piece.x = 0
+        piece.y = GRID_HEIGHT - 3
+        assert game.get_drop_distance(piece) == 1
+
+    def test_heights_follow_line_clear(self, game):
+        """Test column heights shift down and skip emptied columns"""
+        for x in range(GRID_WIDTH):
+            game.place_block(x, GRID_HEIGHT - 1, "I")
+        game.place_block(2, GRID_HEIGHT - 3, "T")
+
+        game.clear_lines()
+        game.finish_clearing_animation()
+
+        assert game.heights[2] == GRID_HEIGHT - 2
+        assert game.heights[0] == GRID_HEIGHT
+        assert game.heights == [
+            next((y for y in range(GRID_HEIGHT) if game.grid[y][x]), GRID_HEIGHT)
+            for x in range(GRID_WIDTH)
+        ]
+
     def test_scoring_single_line(self, game):
         """Test scoring for single line clear"""
         # Fill bottom row except one column
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
 
         initial_score = game.score
         game.clear_lines()
@@ -186,7 +350,7 @@ class TestTetrisGame:
         initial_level = game.level
         # Simulate line clear
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
         game.clear_lines()
 
         # Level progression happens in clear_lines
@@ -228,11 +392,31 @@ class TestTetrisGame:
         assert game.game_over is False
         assert game.clearing_lines == []
 
+    def test_draw_rerenders_text_only_on_change(self, game):
+        """Test score text surface is reused until the score changes"""
+        game.draw()
+        score_surface = game._text_cache["score"][1]
+        game.draw()
+        assert game._text_cache["score"][1] is score_surface
+
+        game.score += 10
+        game.draw()
+        assert game._text_cache["score"][0] == game.score
+        assert game._text_cache["score"][1] is not score_surface
+
+    def test_reset_game_clears_text_cache(self, game):
+        """Test cached text surfaces are dropped on reset"""
+        game.draw()
+        assert set(game._text_cache) == {"score", "level", "lines"}
+
+        game.reset_game()
+        assert not game._text_cache
+
     def test_grid_is_empty_initially(self, game):
         """Test that grid starts empty"""
         for row in game.grid:
             for cell in row:
-                assert cell is None
+                assert cell == 0
 
 
 class TestGameLogic:
@@ -246,11 +430,47 @@ class TestGameLogic:
         yield game
         pygame.quit()
 
+    def test_ghost_cells_cached_until_piece_moves(self, game):
+        """Test ghost and piece cells are reused between frames and refreshed on movement"""
+        game.draw()
+        ghost_cells = game._ghost_cells
+        game.draw()
+        assert game._ghost_cells is ghost_cells
+
+        assert game.move_piece(-1, 0)
+        game.draw()
+        assert game._ghost_cells == [(x - 1, y) for x, y in ghost_cells]
+        assert game._piece_cells == [(x, y) for x, y in game.current_piece.get_blocks() if y >= 0]
+
+    def test_draw_updates_only_dirty_areas(self, game):
+        """Test the grid area is pushed to the display only after placed blocks change"""
+        game.draw()
+        assert game._grid_rect in game._dirty
+        game.draw()
+        assert game._grid_rect not in game._dirty
+
+        game.place_block(0, game.config.GRID_HEIGHT - 1, "I")
+        game.draw()
+        assert game._grid_rect in game._dirty
+
+    def test_window_expose_repaints_full_screen(self, game, monkeypatch):
+        """Test the whole screen is pushed again after the window was exposed or restored"""
+        updates = []
+        monkeypatch.setattr(pygame.display, "update", updates.append)
+        game.draw()
+        for event_type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            game.draw()
+            assert game.screen.get_rect() not in updates[-1]
+
+            game.handle_input(pygame.event.Event(event_type))
+            game.draw()
+            assert game.screen.get_rect() in updates[-1]
+
     def test_line_clear_animation(self, game):
         """Test line clearing animation"""
         # Fill a line
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
 
         game.clear_lines()
 
@@ -258,11 +478,36 @@ class TestGameLogic:
         assert len(game.clearing_lines) > 0
         assert game.clear_animation_time >= 0
 
+    def test_line_clear_animation_draws_every_frame(self, game, monkeypatch):
+        """Test each fade frame blits the cached sprite for its alpha step and allocates nothing"""
+        for x in range(GRID_WIDTH):
+            game.place_block(x, GRID_HEIGHT - 1, "I")
+        game.clear_lines()
+
+        real_surface = pygame.Surface
+        surfaces = []
+        monkeypatch.setattr(
+            pygame, "Surface", lambda *args: surfaces.append(args) or real_surface(*args)
+        )
+        blits = []
+        monkeypatch.setattr(game, "_blit", lambda surface, pos: blits.append((surface, pos)))
+
+        cleared_row = set(game._cell_px[GRID_HEIGHT - 1])
+        for elapsed in range(0, game.clear_animation_duration + 1, 50):
+            game.clear_animation_time = elapsed
+            blits.clear()
+            game.draw()
+
+            alpha = int(255 * (1 - elapsed / game.clear_animation_duration))
+            fade_blits = [surface for surface, pos in blits if pos in cleared_row]
+            assert fade_blits == [game._fade_sprites[alpha >> 4]] * GRID_WIDTH
+        assert not surfaces
+
     def test_animation_completion(self, game):
         """Test animation completes and removes lines"""
         # Fill a line
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
 
         game.clear_lines()
         assert len(game.clearing_lines) == 1
@@ -273,25 +518,63 @@ class TestGameLogic:
         # Lines should be cleared
         assert len(game.clearing_lines) == 0
         # Bottom row should be empty after clearing
-        assert all(cell is None for cell in game.grid[GRID_HEIGHT - 1])
+        assert all(cell == 0 for cell in game.grid[GRID_HEIGHT - 1])
+
+    def test_animation_completion_shifts_blocks_down(self, game):
+        """Test blocks above a cleared line drop by one row"""
+        for x in range(GRID_WIDTH):
+            game.place_block(x, GRID_HEIGHT - 1, "I")
+        game.place_block(3, GRID_HEIGHT - 2, "T")
+
+        game.clear_lines()
+        game.finish_clearing_animation()
+
+        assert game.grid[GRID_HEIGHT - 1][3] == game.piece_ids["T"]
+        assert game.grid[GRID_HEIGHT - 2].sum() == 0
 
     def test_multiple_line_clear(self, game):
         """Test clearing multiple lines at once"""
         # Fill multiple lines
         for y in range(GRID_HEIGHT - 2, GRID_HEIGHT):
             for x in range(GRID_WIDTH):
-                game.grid[y][x] = COLORS["I"]
+                game.place_block(x, y, "I")
 
         game.clear_lines()
 
         # Should detect 2 lines
         assert len(game.clearing_lines) == 2
 
+    def test_non_adjacent_line_clear_compacts_grid(self, game):
+        """Test rows between two cleared lines drop into place"""
+        for x in range(GRID_WIDTH):
+            game.place_block(x, GRID_HEIGHT - 1, "I")
+            game.place_block(x, GRID_HEIGHT - 3, "I")
+        game.place_block(4, GRID_HEIGHT - 2, "S")
+        game.place_block(7, GRID_HEIGHT - 4, "Z")
+
+        game.clear_lines()
+        assert game.clearing_lines == [GRID_HEIGHT - 3, GRID_HEIGHT - 1]
+        game.finish_clearing_animation()
+
+        assert game.grid[GRID_HEIGHT - 1][4] == game.piece_ids["S"]
+        assert game.grid[GRID_HEIGHT - 2][7] == game.piece_ids["Z"]
+        assert int((game.grid != 0).sum()) == 2
+        assert game._row_bits[GRID_HEIGHT - 1] == 1 << 4
+        assert game._row_bits[GRID_HEIGHT - 2] == 1 << 7
+        assert sum(game._row_bits[: GRID_HEIGHT - 2]) == 0
+        assert game._placed_blocks == {
+            (4, GRID_HEIGHT - 1): COLORS["S"],
+            (7, GRID_HEIGHT - 2): COLORS["Z"],
+        }
+        assert game.grid_bits == (1 << ((GRID_HEIGHT - 1) * GRID_WIDTH + 4)) | (
+            1 << ((GRID_HEIGHT - 2) * GRID_WIDTH + 7)
+        )
+
     def test_scoring_increases_with_level(self, game):
         """Test that scoring scales with level"""
         game.level = 1
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
         game.clear_lines()
         score_level_1 = game.score
 
@@ -299,7 +582,7 @@ class TestGameLogic:
         game.reset_game()
         game.level = 2
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
         game.clear_lines()
         score_level_2 = game.score
 
@@ -389,11 +672,47 @@ class TestGameStates:
         assert isinstance(game.state, PlayingState)
         assert game.game_over is False
 
+    def test_overlay_states_draw_cached_surfaces(self, game, monkeypatch):
+        """Test pause and game over frames create no surfaces and render only the final score"""
+
+        class CountingFont:  # pylint: disable=too-few-public-methods
+            """Font wrapper recording every rendered string"""
+
+            def __init__(self, font):
+                self.font = font
+
+            def render(self, text, *args):
+                """Record the text and render it with the wrapped font"""
+                rendered.append(text)
+                return self.font.render(text, *args)
+
+        game.score = 1234
+        game.draw()
+        real_surface = pygame.Surface
+        surfaces = []
+        rendered = []
+        monkeypatch.setattr(
+            pygame, "Surface", lambda *args: surfaces.append(args) or real_surface(*args)
+        )
+        monkeypatch.setattr(game, "font", CountingFont(game.font))
+        monkeypatch.setattr(game, "small_font", CountingFont(game.small_font))
+
+        game.state = PausedState()
+        for _ in range(3):
+            game.draw()
+        assert not rendered
+
+        game.state = GameOverState()
+        for _ in range(3):
+            game.draw()
+        assert rendered == ["Final Score: 1234"]
+        assert not surfaces
+
     def test_line_clearing_state_transition(self, game):
         """Test transitioning to line clearing state"""
         # Fill a line
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
 
         # Trigger line clear
         game.clear_lines()
@@ -405,7 +724,7 @@ class TestGameStates:
         """Test line clearing transitions back to playing"""
         # Fill a line and start clearing
         for x in range(GRID_WIDTH):
-            game.grid[GRID_HEIGHT - 1][x] = COLORS["I"]
+            game.place_block(x, GRID_HEIGHT - 1, "I")
         game.clear_lines()
 
         # Complete the animation
@@ -414,6 +733,30 @@ class TestGameStates:
         # Should be back to playing
         assert isinstance(game.state, PlayingState)
 
+    def test_soft_drop_key_awards_bonus(self, game):
+        """Test Down key moves the piece and awards the soft drop bonus"""
+        original_y = game.current_piece.y
+        event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_DOWN})
+        game.handle_input(event)
+
+        assert game.current_piece.y == original_y + 1
+        assert game.score == GameConfig.SOFT_DROP_BONUS
+
+    def test_ghost_toggle_key(self, game):
+        """Test G key toggles the ghost piece"""
+        event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_g})
+        game.handle_input(event)
+        assert game.show_ghost is False
+
+    def test_unbound_key_is_ignored(self, game):
+        """Test keys without an action leave the game untouched"""
+        original_x = game.current_piece.x
+        event = pygame.event.Event(pygame.KEYDOWN, {"key": pygame.K_z})
+        game.handle_input(event)
+
+        assert game.current_piece.x == original_x
+        assert isinstance(game.state, PlayingState)
+
     def test_paused_state_no_update(self, game):
         """Test that paused state doesn't update game logic"""
         game.state = PausedState()
@@ -498,7 +841,48 @@ class TestGameConfig:
         piece = Tetromino("I", CustomConfig)
         assert piece.config == CustomConfig
         # Verify piece spawns centered in wider grid
-        assert piece.x == CustomConfig.GRID_WIDTH // 2 - len(piece.shape[0]) // 2
+        assert piece.x == CustomConfig.GRID_WIDTH // 2 - len(SHAPES["I"][0]) // 2
+
+        pygame.quit()
+
+    def test_custom_shapes_are_dealt(self):
+        """Test the bag only deals the piece types of a custom config"""
+        pygame.init()
+
+        class CustomConfig(GameConfig):  # pylint: disable=too-few-public-methods
+            """Custom configuration for testing with only I and O pieces"""
+
+            SHAPES = {"I": GameConfig.SHAPES["I"], "O": GameConfig.SHAPES["O"]}
+            COLORS = {"I": GameConfig.COLORS["I"], "O": GameConfig.COLORS["O"]}
+
+        game = TetrisGame(CustomConfig)
+        assert {game.get_random_piece().type for _ in range(20)} == {"I", "O"}
+
+        pygame.quit()
+
+    def test_custom_shapes_are_used(self):
+        """Test that pieces and the game use the shapes of a custom config"""
+        pygame.init()
+
+        class CustomConfig(GameConfig):  # pylint: disable=too-few-public-methods
+            """Custom configuration for testing with a short I and an extra shape"""
+
+            SHAPES = {**GameConfig.SHAPES, "I": [[1, 1, 1]], "X": [[0, 1, 0], [1, 1, 1], [0, 1, 0]]}
+            COLORS = {**GameConfig.COLORS, "X": (255, 255, 255)}
+
+        game = TetrisGame(CustomConfig)
+        piece = Tetromino("I", CustomConfig)
+        assert len(piece.get_blocks()) == 3
+        # A 3-wide I rotates in a 3x3 box with the J/L/S/T/Z kicks, not the 4x4 I ones
+        assert game._piece_tables.kicks["I"] is PIECE_KICKS["T"]
+        assert len(Tetromino("X", CustomConfig).copy().get_blocks()) == 5
+
+        game.current_piece = piece
+        game.rotate_piece()
+        assert game.current_piece.rot == 1
+        assert len(game.current_piece.get_blocks()) == 3
+        game.hard_drop()
+        assert len(game._placed_blocks) == 3
 
         pygame.quit()
 
@@ -539,7 +923,7 @@ class TestGameConfig:
 
         # Fill a line and clear it
         for x in range(game.config.GRID_WIDTH):
-            game.grid[game.config.GRID_HEIGHT - 1][x] = game.config.COLORS["I"]
+            game.place_block(x, game.config.GRID_HEIGHT - 1, "I")
 
         initial_score = game.score
         game.clear_lines()
@@ -3,9 +3,11 @@ Tetris Game - A complete implementation with modern features
 Features: Ghost piece, hold piece, next piece preview, scoring, levels
 """
 
+import functools
 import random
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pygame
 
 # Initialize Pygame
@@ -119,14 +121,135 @@ SHAPES = GameConfig.SHAPES
 COLORS = GameConfig.COLORS
 
 
+def _piece_rotations(shape: List[List[int]]) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Return (x, y) block offsets for the four clockwise rotations of a shape matrix.
+    The shape is centered in a square box and rotated inside it, as in SRS; when an odd
+    amount of padding is needed, the extra row or column goes below or to the right.
+    """
+    size = max(len(shape), len(shape[0]))
+    top = (size - len(shape)) // 2
+    left = (size - len(shape[0])) // 2
+    shape = (
+        [[0] * size for _ in range(top)]
+        + [[0] * left + row + [0] * (size - left - len(row)) for row in shape]
+        + [[0] * size for _ in range(size - top - len(shape))]
+    )
+    rotations = []
+    for _ in range(4):
+        rotations.append(
+            tuple((x, y) for y, row in enumerate(shape) for x, cell in enumerate(row) if cell)
+        )
+        shape = [list(row) for row in zip(*shape[::-1])]
+    return tuple(rotations)
+
+
+KickTable = Tuple[Tuple[Tuple[Tuple[int, int], ...], ...], ...]
+
+
+def _kick_table(kicks: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]]) -> KickTable:
+    """
+    Build a [from_rot][to_rot] lookup of wall kicks from SRS data.
+    SRS lists kicks with y pointing up; they are flipped so y points down the grid.
+    """
+    return tuple(
+        tuple(tuple((dx, -dy) for dx, dy in kicks.get((old, new), ())) for new in range(4))
+        for old in range(4)
+    )
+
+
+# SRS wall kicks tried in order when rotating, per (from, to) rotation state
+KICKS_JLSTZ = _kick_table(
+    {
+        (0, 1): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),
+        (1, 0): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),
+        (1, 2): ((0, 0), (1, 0), (1, -1), (0, 2), (1, 2)),
+        (2, 1): ((0, 0), (-1, 0), (-1, 1), (0, -2), (-1, -2)),
+        (2, 3): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),
+        (3, 2): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),
+        (3, 0): ((0, 0), (-1, 0), (-1, -1), (0, 2), (-1, 2)),
+        (0, 3): ((0, 0), (1, 0), (1, 1), (0, -2), (1, -2)),
+    }
+)
+KICKS_I = _kick_table(
+    {
+        (0, 1): ((0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)),
+        (1, 0): ((0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)),
+        (1, 2): ((0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)),
+        (2, 1): ((0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)),
+        (2, 3): ((0, 0), (2, 0), (-1, 0), (2, 1), (-1, -2)),
+        (3, 2): ((0, 0), (-2, 0), (1, 0), (-2, -1), (1, 2)),
+        (3, 0): ((0, 0), (1, 0), (-2, 0), (1, -2), (-2, 1)),
+        (0, 3): ((0, 0), (-1, 0), (2, 0), (-1, 2), (2, -1)),
+    }
+)
+KICKS_O = _kick_table({(old, new): ((0, 0),) for old in range(4) for new in range(4)})
+
+
+class PieceTables(NamedTuple):
+    """Per-piece-type lookup tables derived from a config's SHAPES."""
+
+    # Block offsets indexed by rotation state (0-3)
+    offsets: Dict[str, Tuple[Tuple[Tuple[int, int], ...], ...]]
+    # (dx, lowest dy) per occupied column, indexed by rotation state
+    column_bottoms: Dict[str, Tuple[Tuple[Tuple[int, int], ...], ...]]
+    # Wall kicks indexed by [from_rot][to_rot]
+    kicks: Dict[str, KickTable]
+
+
+@functools.lru_cache(maxsize=None)
+def piece_tables(config: type) -> PieceTables:
+    """
+    Build the rotation, column-bottom and wall-kick tables for a config class once.
+    Kicks are picked by rotation box size: 4x4 uses the SRS I table, 2x2 the O table
+    and any other size the J/L/S/T/Z table.
+    """
+    offsets = {shape_type: _piece_rotations(shape) for shape_type, shape in config.SHAPES.items()}
+    column_bottoms = {
+        shape_type: tuple(
+            tuple(
+                (dx, max(dy for col, dy in rot_offsets if col == dx))
+                for dx in sorted({col for col, _ in rot_offsets})
+            )
+            for rot_offsets in rotations
+        )
+        for shape_type, rotations in offsets.items()
+    }
+    kicks = {
+        shape_type: {4: KICKS_I, 2: KICKS_O}.get(max(len(shape), len(shape[0])), KICKS_JLSTZ)
+        for shape_type, shape in config.SHAPES.items()
+    }
+    return PieceTables(offsets, column_bottoms, kicks)
+
+
+# Tables for the default config
+PIECE_OFFSETS, PIECE_COLUMN_BOTTOMS, PIECE_KICKS = piece_tables(GameConfig)
+
+
+def mask_at(mask: int, x: int, y: int, width: int) -> int:
+    """
+    Shift a piece bitmask to grid position (x, y).
+    Bit (row * width + col) is one cell; rows above the grid (y < 0) are dropped.
+    """
+    mask <<= x
+    if y >= 0:
+        return mask << (y * width)
+    return mask >> (-y * width)
+
+
 class GameState:
     """
     Base class for representing a game state.
-    Methods are overridden by specific states.
+    Methods are overridden by specific states; _ACTIONS maps key codes to game actions.
     """
 
+    _ACTIONS: Dict[int, Callable[["TetrisGame"], object]] = {}
+
     def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
-        """Handle keyboard input for this state."""
+        """Run the action bound to the pressed key, if any."""
+        action = self._ACTIONS.get(event.key)
+        if action is not None:
+            action(game)
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """
@@ -142,28 +265,17 @@ class GameState:
 class PlayingState(GameState):
     """State representing active gameplay."""
 
-    def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
-        """
-        Process input while playing.
-        Supports movement, rotation, drops, hold piece, pause and ghost toggle.
-        """
-        if event.key == pygame.K_LEFT:
-            game.move_piece(-1, 0)
-        elif event.key == pygame.K_RIGHT:
-            game.move_piece(1, 0)
-        elif event.key == pygame.K_DOWN:
-            if game.move_piece(0, 1):
-                game.score += game.config.SOFT_DROP_BONUS
-        elif event.key == pygame.K_UP:
-            game.rotate_piece()
-        elif event.key == pygame.K_SPACE:
-            game.hard_drop()
-        elif event.key == pygame.K_c:
-            game.hold_current_piece()
-        elif event.key == pygame.K_g:
-            game.show_ghost = not game.show_ghost
-        elif event.key == pygame.K_p:
-            game.state = PausedState()
+    # Movement, rotation, drops, hold piece, ghost toggle and pause
+    _ACTIONS: Dict[int, Callable[["TetrisGame"], object]] = {
+        pygame.K_LEFT: lambda game: game.move_piece(-1, 0),
+        pygame.K_RIGHT: lambda game: game.move_piece(1, 0),
+        pygame.K_DOWN: lambda game: game.soft_drop(),
+        pygame.K_UP: lambda game: game.rotate_piece(),
+        pygame.K_SPACE: lambda game: game.hard_drop(),
+        pygame.K_c: lambda game: game.hold_current_piece(),
+        pygame.K_g: lambda game: game.toggle_ghost(),
+        pygame.K_p: lambda game: game.toggle_pause(),
+    }
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """Auto-drop piece and lock it if movement fails."""
@@ -181,39 +293,33 @@ class PlayingState(GameState):
 class PausedState(GameState):
     """State representing pause menu."""
 
-    def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
-        """Unpause when pressing P."""
-        if event.key == pygame.K_p:
-            game.state = PlayingState()
+    # Unpause when pressing P
+    _ACTIONS: Dict[int, Callable[["TetrisGame"], object]] = {
+        pygame.K_p: lambda game: game.toggle_pause(),
+    }
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """No updates while paused"""
 
     def draw(self, game: "TetrisGame") -> None:
         """Draw semi-transparent pause overlay with text."""
-        overlay = pygame.Surface((game.config.SCREEN_WIDTH, game.config.SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(game.config.BLACK)
-        game.screen.blit(overlay, (0, 0))
+        game._blit(game._pause_overlay, (0, 0))
 
-        pause_text = game.font.render("PAUSED", True, game.config.WHITE)
-        continue_text = game.small_font.render("Press P to Continue", True, game.config.WHITE)
+        pause_text = game._pause_text
+        continue_text = game._continue_text
 
-        game.screen.blit(
+        game._blit(
             pause_text,
             (game.config.SCREEN_WIDTH // 2 - pause_text.get_width() // 2, 250),
         )
-        game.screen.blit(
+        game._blit(
             continue_text,
             (game.config.SCREEN_WIDTH // 2 - continue_text.get_width() // 2, 320),
         )
 
 
 class LineClearingState(GameState):
-    """State representing line-clearing fade animation."""
-
-    def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
-        """No input handling during line clearing"""
+    """State representing line-clearing fade animation; it ignores all input."""
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """Update fade animation progress and complete when time is up."""
@@ -229,35 +335,31 @@ class LineClearingState(GameState):
 class GameOverState(GameState):
     """State shown after a losing position occurs."""
 
-    def handle_input(self, event: pygame.event.Event, game: "TetrisGame") -> None:
-        """Restart game when pressing R."""
-        if event.key == pygame.K_r:
-            game.reset_game()
-            game.state = PlayingState()
+    # Restart game when pressing R
+    _ACTIONS: Dict[int, Callable[["TetrisGame"], object]] = {
+        pygame.K_r: lambda game: game.reset_game(),
+    }
 
     def update(self, delta_time: int, game: "TetrisGame") -> None:
         """No updates in game over state"""
 
     def draw(self, game: "TetrisGame") -> None:
         """Show game over overlay and final score."""
-        overlay = pygame.Surface((game.config.SCREEN_WIDTH, game.config.SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(game.config.BLACK)
-        game.screen.blit(overlay, (0, 0))
+        game._blit(game._game_over_overlay, (0, 0))
 
-        game_over_text = game.font.render("GAME OVER", True, game.config.RED)
-        score_text = game.font.render(f"Final Score: {game.score}", True, game.config.WHITE)
-        restart_text = game.small_font.render("Press R to Restart", True, game.config.WHITE)
+        game_over_text = game._game_over_text
+        score_text = game._get_text("final_score", game.score, "Final Score: {}")
+        restart_text = game._restart_text
 
-        game.screen.blit(
+        game._blit(
             game_over_text,
             (game.config.SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 250),
         )
-        game.screen.blit(
+        game._blit(
             score_text,
             (game.config.SCREEN_WIDTH // 2 - score_text.get_width() // 2, 320),
         )
-        game.screen.blit(
+        game._blit(
             restart_text,
             (game.config.SCREEN_WIDTH // 2 - restart_text.get_width() // 2, 400),
         )
@@ -265,15 +367,17 @@ class GameOverState(GameState):
 
 class Tetromino:
     """
-    Represents a falling Tetris piece and its rotation matrix.
+    Represents a falling Tetris piece by its type and rotation state.
     Attributes:
     type: String key like "I", "O", etc.
-    shape: 2D list defining block cells.
-    color: RGB tuple.
+    rot: Rotation state (0-3) indexing the config's piece offsets.
     x: Grid X coordinate (integer cell index).
     y: Grid Y coordinate.
+    config: Configuration class the piece was created with.
     """
 
+    __slots__ = ("type", "rot", "x", "y", "config", "_offsets")
+
     def __init__(self, shape_type: str, config: Optional[type] = None) -> None:
         """
         Initialize a Tetromino.
@@ -286,35 +390,41 @@ class Tetromino:
         if config is None:
             config = GameConfig
         self.type = shape_type
-        self.shape = [row[:] for row in config.SHAPES[shape_type]]
-        self.color = config.COLORS[shape_type]
-        self.x = config.GRID_WIDTH // 2 - len(self.shape[0]) // 2
-        self.y = 0
+        self.rot = 0
+        shape = config.SHAPES[shape_type]
+        # Center the piece's rotation box horizontally
+        self.x = config.GRID_WIDTH // 2 - max(len(shape), len(shape[0])) // 2
+        # Spawn with the topmost block on the first row
+        self._offsets = piece_tables(config).offsets[shape_type]
+        self.y = -min(dy for _, dy in self._offsets[0])
         self.config = config
 
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        """RGB color of this piece type."""
+        return self.config.COLORS[self.type]
+
     def rotate_clockwise(self) -> None:
-        """Rotate piece 90 degrees clockwise by matrix transpose + reverse."""
-        self.shape = [list(row) for row in zip(*self.shape[::-1])]
+        """Rotate piece 90 degrees clockwise."""
+        self.rot = (self.rot + 1) & 3
 
     def rotate_counterclockwise(self) -> None:
         """Rotate piece 90 degrees counterclockwise."""
-        self.shape = [list(row) for row in zip(*self.shape)][::-1]
+        self.rot = (self.rot - 1) & 3
 
     def get_blocks(self) -> List[Tuple[int, int]]:
         """Return list of (x, y) grid coordinates occupied by this piece."""
-        blocks = []
-        for y, row in enumerate(self.shape):
-            for x, cell in enumerate(row):
-                if cell:
-                    blocks.append((self.x + x, self.y + y))
-        return blocks
+        return [(self.x + dx, self.y + dy) for dx, dy in self._offsets[self.rot]]
 
     def copy(self) -> "Tetromino":
         """Create a separate copy of the piece, preserving orientation."""
-        new_piece = Tetromino(self.type, self.config)
-        new_piece.shape = [row[:] for row in self.shape]
+        new_piece = Tetromino.__new__(Tetromino)
+        new_piece.type = self.type
+        new_piece.rot = self.rot
         new_piece.x = self.x
         new_piece.y = self.y
+        new_piece.config = self.config
+        new_piece._offsets = self._offsets
         return new_piece
 
 
@@ -342,10 +452,90 @@ class TetrisGame:
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
 
-        # Game state
-        self.grid = [
-            [None for _ in range(self.config.GRID_WIDTH)] for _ in range(self.config.GRID_HEIGHT)
+        # Pixel positions of every cell's block and ghost sprite
+        block_size = self.config.BLOCK_SIZE
+        left, top = self.config.GRID_X, self.config.GRID_Y
+        right = left + self.config.GRID_WIDTH * block_size
+        bottom = top + self.config.GRID_HEIGHT * block_size
+        self._cell_px = [
+            [
+                (left + x * block_size + 1, top + y * block_size + 1)
+                for x in range(self.config.GRID_WIDTH)
+            ]
+            for y in range(self.config.GRID_HEIGHT)
         ]
+        self._ghost_px = [[(px + 1, py + 1) for px, py in row] for row in self._cell_px]
+        self._grid_rect = pygame.Rect(left, top, right - left, bottom - top)
+        # Grid lines as two S-shaped polylines (one vertical, one horizontal); the
+        # connecting segments run along the grid border, which is drawn anyway
+        self._grid_polylines: List[List[Tuple[int, int]]] = [[], []]
+        for x in range(self.config.GRID_WIDTH + 1):
+            ends = [(left + x * block_size, top), (left + x * block_size, bottom)]
+            self._grid_polylines[0].extend(ends if x % 2 == 0 else ends[::-1])
+        for y in range(self.config.GRID_HEIGHT + 1):
+            ends = [(left, top + y * block_size), (right, top + y * block_size)]
+            self._grid_polylines[1].extend(ends if y % 2 == 0 else ends[::-1])
+
+        # Pre-rendered static content and (value, surface) caches for UI text
+        self._bg_surface = self._build_background()
+        self._block_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        self._ghost_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        for color in set(self.config.COLORS.values()):
+            self._block_sprites[color] = self._build_block_sprite(color)
+            self._ghost_sprites[color] = self._build_ghost_sprite(color)
+        # Pause and game over overlays with their static text
+        self._pause_overlay = self._build_overlay(180)
+        self._game_over_overlay = self._build_overlay(200)
+        self._pause_text = self.font.render("PAUSED", True, self.config.WHITE)
+        self._continue_text = self.small_font.render("Press P to Continue", True, self.config.WHITE)
+        self._game_over_text = self.font.render("GAME OVER", True, self.config.RED)
+        self._restart_text = self.small_font.render("Press R to Restart", True, self.config.WHITE)
+        # White line-clear fade cells for 16 alpha levels, indexed by alpha >> 4
+        self._fade_sprites = [self._build_fade_sprite(i * 17) for i in range(16)]
+        # (value, surface) per dynamic text field, re-rendered only when the value changes
+        self._text_cache: Dict[str, Tuple[int, pygame.Surface]] = {}
+        # Screen areas changed this frame and last frame; only these are pushed to the
+        # display, so whatever was drawn last frame is erased along with the new content
+        self._dirty: List[pygame.Rect] = []
+        self._prev_dirty: List[pygame.Rect] = [self.screen.get_rect()]
+        # Placed blocks are only pushed to the display after they changed
+        self._grid_dirty = True
+
+        # Rotation, column-bottom and wall-kick tables for this config's shapes
+        self._piece_tables = piece_tables(self.config)
+
+        # Piece-type IDs stored in the grid (0 == empty)
+        self.piece_ids = {shape_type: i for i, shape_type in enumerate(self.config.SHAPES, start=1)}
+
+        # Per-rotation (bitmask, min dx, max dx, max dy) for bitboard collision checks;
+        # mask columns start at min dx so the mask is shifted by x + min dx
+        self.piece_masks = {
+            shape_type: tuple(
+                (
+                    sum(
+                        1 << (dy * self.config.GRID_WIDTH + dx - min(col for col, _ in offsets))
+                        for dx, dy in offsets
+                    ),
+                    min(dx for dx, _ in offsets),
+                    max(dx for dx, _ in offsets),
+                    max(dy for _, dy in offsets),
+                )
+                for offsets in self._piece_tables.offsets[shape_type]
+            )
+            for shape_type in self.piece_ids
+        }
+
+        # Game state: grid holds piece IDs, kept only for external and test inspection
+        # (nothing in the game reads it); grid_bits holds occupancy
+        self.grid = np.zeros((self.config.GRID_HEIGHT, self.config.GRID_WIDTH), dtype=np.uint8)
+        self.grid_bits = 0
+        # Per-row occupancy bits (bit x == column x) for full-line detection
+        self._row_bits = [0] * self.config.GRID_HEIGHT
+        self._full_row = (1 << self.config.GRID_WIDTH) - 1
+        # Color of every placed block keyed by (x, y), so drawing skips empty cells
+        self._placed_blocks: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+        # Row index of the topmost block per column (GRID_HEIGHT == empty column)
+        self.heights = [self.config.GRID_HEIGHT] * self.config.GRID_WIDTH
         self.current_piece: Optional[Tetromino] = None
         self.next_piece: Optional[Tetromino] = None
         self.hold_piece: Optional[Tetromino] = None
@@ -370,13 +560,25 @@ class TetrisGame:
         # State pattern
         self.state: GameState = PlayingState()
 
+        # 7-bag randomizer: every piece type is dealt once per shuffled bag
+        self._bag: List[str] = []
+        self._piece_keys = tuple(self.config.SHAPES)
+
+        # Visible cells of the current piece and its ghost, recomputed when dirty
+        self._piece_cells: List[Tuple[int, int]] = []
+        self._ghost_cells: List[Tuple[int, int]] = []
+        self._ghost_dirty = True
+
         # Initialize first pieces
         self.next_piece = self.get_random_piece()
         self.spawn_new_piece()
 
     def get_random_piece(self) -> Tetromino:
-        """Return a random Tetromino instance."""
-        return Tetromino(random.choice(list(self.config.SHAPES.keys())), self.config)
+        """Return the next Tetromino from the bag, refilling and shuffling it when empty."""
+        if not self._bag:
+            self._bag = list(self._piece_keys)
+            random.shuffle(self._bag)
+        return Tetromino(self._bag.pop(), self.config)
 
     def spawn_new_piece(self) -> None:
         """
@@ -386,6 +588,7 @@ class TetrisGame:
         self.current_piece = self.next_piece
         self.next_piece = self.get_random_piece()
         self.can_hold = True
+        self._ghost_dirty = True
 
         # Check if game over
         if not self.is_valid_position(self.current_piece):
@@ -402,19 +605,20 @@ class TetrisGame:
         Returns:
         True if all blocks are inside bounds and not colliding.
         """
-        for x, y in piece.get_blocks():
-            new_x = x + offset_x
-            new_y = y + offset_y
+        mask, min_dx, max_dx, max_dy = self.piece_masks[piece.type][piece.rot]
+        new_x = piece.x + offset_x
+        new_y = piece.y + offset_y
 
-            # Check boundaries
-            if new_x < 0 or new_x >= self.config.GRID_WIDTH or new_y >= self.config.GRID_HEIGHT:
-                return False
+        # Check boundaries
+        if (
+            new_x + min_dx < 0
+            or new_x + max_dx >= self.config.GRID_WIDTH
+            or new_y + max_dy >= self.config.GRID_HEIGHT
+        ):
+            return False
 
-            # Check collision with placed blocks
-            if new_y >= 0 and self.grid[new_y][new_x] is not None:
-                return False
-
-        return True
+        # Check collision with placed blocks
+        return not self.grid_bits & mask_at(mask, new_x + min_dx, new_y, self.config.GRID_WIDTH)
 
     def move_piece(self, dx: int, dy: int) -> bool:
         """
@@ -428,30 +632,50 @@ class TetrisGame:
         if self.is_valid_position(self.current_piece, dx, dy):
             self.current_piece.x += dx
             self.current_piece.y += dy
+            self._ghost_dirty = True
             return True
         return False
 
     def rotate_piece(self) -> None:
-        """Attempt rotation with simple wall kicks."""
-        original_shape = [row[:] for row in self.current_piece.shape]
-        self.current_piece.rotate_clockwise()
+        """Attempt clockwise rotation with SRS wall kicks."""
+        piece = self.current_piece
+        original_rot = piece.rot
+        piece.rot = (original_rot + 1) & 3
 
         # Try wall kicks
-        kicks = [(0, 0), (-1, 0), (1, 0), (0, -1), (-1, -1), (1, -1)]
-        for dx, dy in kicks:
-            if self.is_valid_position(self.current_piece, dx, dy):
-                self.current_piece.x += dx
-                self.current_piece.y += dy
+        for dx, dy in self._piece_tables.kicks[piece.type][original_rot][piece.rot]:
+            if self.is_valid_position(piece, dx, dy):
+                piece.x += dx
+                piece.y += dy
+                self._ghost_dirty = True
                 return
 
-        # Rotation failed, restore original shape
-        self.current_piece.shape = original_shape
+        # Rotation failed, restore original orientation
+        piece.rot = original_rot
+
+    def soft_drop(self) -> None:
+        """Move piece down one row, awarding the soft drop bonus if it moved."""
+        if self.move_piece(0, 1):
+            self.score += self.config.SOFT_DROP_BONUS
+
+    def get_drop_distance(self, piece: Tetromino) -> int:
+        """Return how many rows piece can fall before it lands, using column heights."""
+        drop = self.config.GRID_HEIGHT
+        for dx, bottom in self._piece_tables.column_bottoms[piece.type][piece.rot]:
+            gap = self.heights[piece.x + dx] - (piece.y + bottom) - 1
+            if gap < 0:
+                # Piece is tucked under an overhang, so step down cell by cell
+                drop = 0
+                while self.is_valid_position(piece, 0, drop + 1):
+                    drop += 1
+                return drop
+            drop = min(drop, gap)
+        return drop
 
     def hard_drop(self) -> None:
         """Drop piece instantly to floor, awarding bonus points."""
-        drop_distance = 0
-        while self.move_piece(0, 1):
-            drop_distance += 1
+        drop_distance = self.get_drop_distance(self.current_piece)
+        self.current_piece.y += drop_distance
 
         self.score += drop_distance * self.config.HARD_DROP_BONUS
         self.lock_piece()
@@ -459,15 +683,24 @@ class TetrisGame:
     def get_ghost_piece(self) -> Tetromino:
         """Return ghost copy showing landing position of current piece."""
         ghost = self.current_piece.copy()
-        while self.is_valid_position(ghost, 0, 1):
-            ghost.y += 1
+        ghost.y += self.get_drop_distance(ghost)
         return ghost
 
+    def place_block(self, x: int, y: int, shape_type: str) -> None:
+        """Fill one grid cell with a block of the given piece type."""
+        self.grid[y, x] = self.piece_ids[shape_type]
+        self.grid_bits |= 1 << (y * self.config.GRID_WIDTH + x)
+        self._row_bits[y] |= 1 << x
+        self.heights[x] = min(self.heights[x], y)
+        self._placed_blocks[(x, y)] = self.config.COLORS[shape_type]
+        self._ghost_dirty = True
+        self._grid_dirty = True
+
     def lock_piece(self) -> None:
         """Place piece permanently into grid and check for line clears."""
         for x, y in self.current_piece.get_blocks():
             if y >= 0:
-                self.grid[y][x] = self.current_piece.color
+                self.place_block(x, y, self.current_piece.type)
 
         self.clear_lines()
         if not self.clearing_lines:
@@ -481,11 +714,8 @@ class TetrisGame:
         Updates score and level.
         Switches state to LineClearingState if necessary.
         """
-        lines_to_clear = []
-
-        for y in range(self.config.GRID_HEIGHT):
-            if all(self.grid[y][x] is not None for x in range(self.config.GRID_WIDTH)):
-                lines_to_clear.append(y)
+        full_row = self._full_row
+        lines_to_clear = [y for y, bits in enumerate(self._row_bits) if bits == full_row]
 
         if lines_to_clear:
             # Start animation
@@ -515,9 +745,42 @@ class TetrisGame:
     def finish_clearing_animation(self) -> None:
         """Remove cleared lines and shift grid downward after animation."""
         if self.clearing_lines:
-            for y in reversed(self.clearing_lines):
-                del self.grid[y]
-                self.grid.insert(0, [None for _ in range(self.config.GRID_WIDTH)])
+            height = self.config.GRID_HEIGHT
+            shift = len(self.clearing_lines)
+
+            # Compact the kept rows to the bottom in one vectorized copy
+            keep = np.ones(height, dtype=bool)
+            keep[self.clearing_lines] = False
+            new_grid = np.zeros_like(self.grid)
+            new_grid[shift:] = self.grid[keep]
+            self.grid = new_grid
+
+            # Move drawable blocks to their new rows, dropping the cleared ones
+            new_rows = dict(zip(np.flatnonzero(keep).tolist(), range(shift, height)))
+            self._placed_blocks = {
+                (x, new_rows[y]): color
+                for (x, y), color in self._placed_blocks.items()
+                if y in new_rows
+            }
+            self._grid_dirty = True
+
+            # Shift occupancy bits above each cleared row down by one, top to bottom
+            width = self.config.GRID_WIDTH
+            for y in self.clearing_lines:
+                del self._row_bits[y]
+                self._row_bits.insert(0, 0)
+                above = self.grid_bits & ((1 << (y * width)) - 1)
+                below = self.grid_bits >> ((y + 1) * width) << ((y + 1) * width)
+                self.grid_bits = below | (above << width)
+
+            # Each column's top moves down by the number of cleared rows, unless its
+            # top block was itself cleared; then scan down to the next block
+            for x, top in enumerate(self.heights):
+                if top < height:
+                    top += shift
+                    while top < height and not self._row_bits[top] >> x & 1:
+                        top += 1
+                    self.heights[x] = top
             self.clearing_lines = []
             self.spawn_new_piece()
 
@@ -536,169 +799,197 @@ class TetrisGame:
             self.hold_piece = Tetromino(temp_type, self.config)
 
         self.can_hold = False
+        self._ghost_dirty = True
 
-    def draw_grid(self) -> None:
-        """Render grid background, lines, ghost, active piece and blocks."""
-        # Draw background
-        grid_rect = pygame.Rect(
-            self.config.GRID_X,
-            self.config.GRID_Y,
-            self.config.GRID_WIDTH * self.config.BLOCK_SIZE,
-            self.config.GRID_HEIGHT * self.config.BLOCK_SIZE,
-        )
-        pygame.draw.rect(self.screen, self.config.DARK_GRAY, grid_rect)
+    def _build_background(self) -> pygame.Surface:
+        """Render static content (grid, grid lines, preview boxes, controls) once."""
+        background = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        background.fill(self.config.BLACK)
+
+        # Draw grid background
+        pygame.draw.rect(background, self.config.DARK_GRAY, self._grid_rect)
 
         # Draw grid lines
-        for x in range(self.config.GRID_WIDTH + 1):
-            pygame.draw.line(
-                self.screen,
-                self.config.GRAY,
-                (self.config.GRID_X + x * self.config.BLOCK_SIZE, self.config.GRID_Y),
-                (
-                    self.config.GRID_X + x * self.config.BLOCK_SIZE,
-                    self.config.GRID_Y + self.config.GRID_HEIGHT * self.config.BLOCK_SIZE,
-                ),
-            )
+        for points in self._grid_polylines:
+            pygame.draw.lines(background, self.config.GRAY, False, points)
 
-        for y in range(self.config.GRID_HEIGHT + 1):
-            pygame.draw.line(
-                self.screen,
-                self.config.GRAY,
-                (self.config.GRID_X, self.config.GRID_Y + y * self.config.BLOCK_SIZE),
-                (
-                    self.config.GRID_X + self.config.GRID_WIDTH * self.config.BLOCK_SIZE,
-                    self.config.GRID_Y + y * self.config.BLOCK_SIZE,
-                ),
-            )
+        # Draw next and hold preview boxes
+        for title, x, y in (("NEXT", 580, 100), ("HOLD", 580, 250)):
+            title_text = self.small_font.render(title, True, self.config.WHITE)
+            background.blit(title_text, (x, y - 30))
+
+            box_rect = pygame.Rect(x, y, 120, 100)
+            pygame.draw.rect(background, self.config.DARK_GRAY, box_rect)
+            pygame.draw.rect(background, self.config.WHITE, box_rect, 2)
+
+        # Draw controls
+        controls = [
+            "Controls:",
+            "Left/Right: Move",
+            "Down: Soft Drop",
+            "Up: Rotate",
+            "SPACE: Hard Drop",
+            "C: Hold",
+            "P: Pause",
+            "G: Toggle Ghost",
+            "ESC: Quit",
+        ]
+
+        for i, control in enumerate(controls):
+            control_text = self.small_font.render(control, True, self.config.WHITE)
+            background.blit(control_text, (50, 400 + i * 30))
+
+        return background
+
+    def _build_overlay(self, alpha: int) -> pygame.Surface:
+        """Render a translucent black full-screen overlay."""
+        overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        overlay.set_alpha(alpha)
+        overlay.fill(self.config.BLACK)
+        return overlay
+
+    def _build_block_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render one block cell with its highlight for a 3D effect."""
+        sprite = pygame.Surface((self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2))
+        sprite.fill(color)
+
+        rect = sprite.get_rect()
+        highlight = tuple(min(c + 40, 255) for c in color)
+        pygame.draw.line(sprite, highlight, (rect.left, rect.top), (rect.right, rect.top), 2)
+        pygame.draw.line(sprite, highlight, (rect.left, rect.top), (rect.left, rect.bottom), 2)
+        return sprite.convert()
+
+    def _build_ghost_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render one transparent ghost cell with a 2 px outline."""
+        sprite = pygame.Surface(
+            (self.config.BLOCK_SIZE - 4, self.config.BLOCK_SIZE - 4), pygame.SRCALPHA
+        )
+        pygame.draw.rect(sprite, color, sprite.get_rect(), 2)
+        return sprite.convert_alpha()
+
+    def _build_fade_sprite(self, alpha: int) -> pygame.Surface:
+        """Render one white line-clear cell at the given alpha."""
+        sprite = pygame.Surface(
+            (self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2), pygame.SRCALPHA
+        )
+        sprite.fill((*self.config.WHITE, alpha))
+        return sprite.convert_alpha()
+
+    def toggle_ghost(self) -> None:
+        """Show or hide the ghost piece."""
+        self.show_ghost = not self.show_ghost
+
+    def toggle_pause(self) -> None:
+        """Switch between gameplay and the pause menu."""
+        if isinstance(self.state, PausedState):
+            self.state = PlayingState()
+        else:
+            self.state = PausedState()
 
-        # Draw placed blocks
-        for y in range(self.config.GRID_HEIGHT):
-            for x in range(self.config.GRID_WIDTH):
-                if self.grid[y][x] is not None:
-                    self.draw_block(x, y, self.grid[y][x])
+    def draw_grid(self) -> None:
+        """Render placed blocks, clearing animation, ghost and active piece."""
+        # Draw placed blocks; the grid area is only marked dirty after they changed
+        block_sprites = self._block_sprites
+        for (x, y), color in self._placed_blocks.items():
+            self.screen.blit(block_sprites[color], self._cell_px[y][x])
+        if self._grid_dirty:
+            self._dirty.append(self._grid_rect)
+            self._grid_dirty = False
 
         # Draw clearing animation
         if self.clearing_lines:
             progress = self.clear_animation_time / self.clear_animation_duration
-            alpha = int(255 * (1 - progress))
+            alpha = min(max(int(255 * (1 - progress)), 0), 255)
+            fade_sprite = self._fade_sprites[alpha >> 4]
 
             for y in self.clearing_lines:
-                for x in range(self.config.GRID_WIDTH):
-                    rect = pygame.Rect(
-                        self.config.GRID_X + x * self.config.BLOCK_SIZE + 1,
-                        self.config.GRID_Y + y * self.config.BLOCK_SIZE + 1,
-                        self.config.BLOCK_SIZE - 2,
-                        self.config.BLOCK_SIZE - 2,
-                    )
-                    # Create a surface with alpha for fade effect
-                    surf = pygame.Surface((self.config.BLOCK_SIZE - 2, self.config.BLOCK_SIZE - 2))
-                    surf.set_alpha(alpha)
-                    surf.fill(self.config.WHITE)
-                    self.screen.blit(surf, (rect.x, rect.y))
+                for pos in self._cell_px[y]:
+                    self._blit(fade_sprite, pos)
+
+        if not self.current_piece:
+            return
+
+        # Recompute visible piece and ghost cells only after the piece or grid changed
+        if self._ghost_dirty:
+            blocks = self.current_piece.get_blocks()
+            drop = self.get_drop_distance(self.current_piece)
+            self._piece_cells = [(x, y) for x, y in blocks if y >= 0]
+            self._ghost_cells = [(x, y + drop) for x, y in blocks if y + drop >= 0]
+            self._ghost_dirty = False
 
         # Draw ghost piece
-        if self.current_piece and self.show_ghost and not self.clearing_lines:
-            ghost = self.get_ghost_piece()
-            for x, y in ghost.get_blocks():
-                if y >= 0:
-                    rect = pygame.Rect(
-                        self.config.GRID_X + x * self.config.BLOCK_SIZE + 2,
-                        self.config.GRID_Y + y * self.config.BLOCK_SIZE + 2,
-                        self.config.BLOCK_SIZE - 4,
-                        self.config.BLOCK_SIZE - 4,
-                    )
-                    pygame.draw.rect(self.screen, self.current_piece.color, rect, 2)
+        if self.show_ghost and not self.clearing_lines:
+            ghost_sprite = self._ghost_sprites[self.current_piece.color]
+            for x, y in self._ghost_cells:
+                self._blit(ghost_sprite, self._ghost_px[y][x])
 
         # Draw current piece
-        if self.current_piece:
-            for x, y in self.current_piece.get_blocks():
-                if y >= 0:
-                    self.draw_block(x, y, self.current_piece.color)
+        for x, y in self._piece_cells:
+            self.draw_block(x, y, self.current_piece.color)
 
     def draw_block(self, x: int, y: int, color: Tuple[int, int, int]) -> None:
-        """Draw one grid cell with shading effect."""
-        rect = pygame.Rect(
-            self.config.GRID_X + x * self.config.BLOCK_SIZE + 1,
-            self.config.GRID_Y + y * self.config.BLOCK_SIZE + 1,
-            self.config.BLOCK_SIZE - 2,
-            self.config.BLOCK_SIZE - 2,
-        )
-        pygame.draw.rect(self.screen, color, rect)
+        """Draw one grid cell using the pre-rendered sprite for its color."""
+        self._blit(self._block_sprites[color], self._cell_px[y][x])
 
-        # Add highlight for 3D effect
-        highlight = tuple(min(c + 40, 255) for c in color)
-        pygame.draw.line(self.screen, highlight, (rect.left, rect.top), (rect.right, rect.top), 2)
-        pygame.draw.line(self.screen, highlight, (rect.left, rect.top), (rect.left, rect.bottom), 2)
+    def _blit(self, surface: pygame.Surface, pos: Tuple[int, int]) -> None:
+        """Blit onto the screen and record the covered area for the display update."""
+        self._dirty.append(self.screen.blit(surface, pos))
 
-    def draw_piece_preview(self, piece: Optional[Tetromino], x: int, y: int, title: str) -> None:
-        """Draw preview box for next or hold piece."""
-        # Draw title
-        title_text = self.small_font.render(title, True, self.config.WHITE)
-        self.screen.blit(title_text, (x, y - 30))
+    def draw_piece_preview(self, piece: Optional[Tetromino], x: int, y: int) -> None:
+        """Draw next or hold piece centered in its preview box."""
+        if piece:
+            offsets = self._piece_tables.offsets[piece.type][piece.rot]
+            min_dx = min(dx for dx, _ in offsets)
+            min_dy = min(dy for _, dy in offsets)
+            cols = max(dx for dx, _ in offsets) - min_dx + 1
+            rows = max(dy for _, dy in offsets) - min_dy + 1
+            offset_x = x + 60 - cols * self.config.BLOCK_SIZE // 2 - min_dx * self.config.BLOCK_SIZE
+            offset_y = y + 50 - rows * self.config.BLOCK_SIZE // 2 - min_dy * self.config.BLOCK_SIZE
+
+            for dx, dy in offsets:
+                rect = pygame.Rect(
+                    offset_x + dx * self.config.BLOCK_SIZE,
+                    offset_y + dy * self.config.BLOCK_SIZE,
+                    self.config.BLOCK_SIZE - 2,
+                    self.config.BLOCK_SIZE - 2,
+                )
+                self._dirty.append(pygame.draw.rect(self.screen, piece.color, rect))
 
-        # Draw box
-        box_rect = pygame.Rect(x, y, 120, 100)
-        pygame.draw.rect(self.screen, self.config.DARK_GRAY, box_rect)
-        pygame.draw.rect(self.screen, self.config.WHITE, box_rect, 2)
+    def _get_text(self, key: str, value: int, fmt: str) -> pygame.Surface:
+        """Return the rendered text for a field, re-rendering only when its value changed."""
+        cached = self._text_cache.get(key)
+        if cached is not None and cached[0] == value:
+            return cached[1]
 
-        # Draw piece centered in box
-        if piece:
-            offset_x = x + 60 - len(piece.shape[0]) * self.config.BLOCK_SIZE // 2
-            offset_y = y + 50 - len(piece.shape) * self.config.BLOCK_SIZE // 2
-
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        rect = pygame.Rect(
-                            offset_x + col_idx * self.config.BLOCK_SIZE,
-                            offset_y + row_idx * self.config.BLOCK_SIZE,
-                            self.config.BLOCK_SIZE - 2,
-                            self.config.BLOCK_SIZE - 2,
-                        )
-                        pygame.draw.rect(self.screen, piece.color, rect)
+        surface = self.font.render(fmt.format(value), True, self.config.WHITE)
+        self._text_cache[key] = (value, surface)
+        return surface
 
     def draw_ui(self) -> None:
-        """Draw score, level, lines, next and hold previews, and controls."""
+        """Draw score, level, lines and the next and hold pieces."""
         # Score
-        score_text = self.font.render(f"Score: {self.score}", True, self.config.WHITE)
-        self.screen.blit(score_text, (50, 100))
+        self._blit(self._get_text("score", self.score, "Score: {}"), (50, 100))
 
         # Level
-        level_text = self.font.render(f"Level: {self.level}", True, self.config.WHITE)
-        self.screen.blit(level_text, (50, 150))
+        self._blit(self._get_text("level", self.level, "Level: {}"), (50, 150))
 
         # Lines
-        lines_text = self.font.render(f"Lines: {self.lines_cleared}", True, self.config.WHITE)
-        self.screen.blit(lines_text, (50, 200))
+        self._blit(self._get_text("lines", self.lines_cleared, "Lines: {}"), (50, 200))
 
         # Next piece
-        self.draw_piece_preview(self.next_piece, 580, 100, "NEXT")
+        self.draw_piece_preview(self.next_piece, 580, 100)
 
         # Hold piece
-        self.draw_piece_preview(self.hold_piece, 580, 250, "HOLD")
-
-        # Controls
-        controls = [
-            "Controls:",
-            "Left/Right: Move",
-            "Down: Soft Drop",
-            "Up: Rotate",
-            "SPACE: Hard Drop",
-            "C: Hold",
-            "P: Pause",
-            "G: Toggle Ghost",
-            "ESC: Quit",
-        ]
-
-        for i, control in enumerate(controls):
-            control_text = self.small_font.render(control, True, self.config.WHITE)
-            self.screen.blit(control_text, (50, 400 + i * 30))
+        self.draw_piece_preview(self.hold_piece, 580, 250)
 
     def reset_game(self) -> None:
         """Reset grid, stats and pieces to initial state."""
-        self.grid = [
-            [None for _ in range(self.config.GRID_WIDTH)] for _ in range(self.config.GRID_HEIGHT)
-        ]
+        self.grid.fill(0)
+        self.grid_bits = 0
+        self._row_bits = [0] * self.config.GRID_HEIGHT
+        self._placed_blocks = {}
+        self._grid_dirty = True
+        self.heights = [self.config.GRID_HEIGHT] * self.config.GRID_WIDTH
         self.score = 0
         self.level = 1
         self.lines_cleared = 0
@@ -706,6 +997,8 @@ class TetrisGame:
         self.fall_speed = self.config.INITIAL_FALL_SPEED
         self.clearing_lines = []
         self.clear_animation_time = 0
+        self._text_cache.clear()
+        self._bag = []
         self.next_piece = self.get_random_piece()
         self.hold_piece = None
         self.can_hold = True
@@ -713,9 +1006,12 @@ class TetrisGame:
         self.spawn_new_piece()
 
     def handle_input(self, event: pygame.event.Event) -> None:
-        """Forward input to current state."""
+        """Forward key input to current state; repaint the whole window once it is exposed."""
         if event.type == pygame.KEYDOWN:
             self.state.handle_input(event, self)
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            # The window contents may be gone, so the next frame pushes the full screen
+            self._prev_dirty = [self.screen.get_rect()]
 
     def update(self, delta_time: int) -> None:
         """Update game logic if game is not over."""
@@ -725,15 +1021,17 @@ class TetrisGame:
         self.state.update(delta_time, self)
 
     def draw(self) -> None:
-        """Render full frame including grid and UI."""
-        self.screen.fill(self.config.BLACK)
+        """Render full frame including grid and UI, updating only the changed areas."""
+        self._dirty = []
+        self.screen.blit(self._bg_surface, (0, 0))
         self.draw_grid()
         self.draw_ui()
 
         # Delegate state-specific drawing to current state
         self.state.draw(self)
 
-        pygame.display.flip()
+        pygame.display.update(self._prev_dirty + self._dirty)
+        self._prev_dirty = self._dirty
 
     def run(self) -> None:
         """Main loop handling events, updates and drawing."""
@@ -750,6 +1048,8 @@ class TetrisGame:
                         running = False
                     else:
                         self.handle_input(event)
+                else:
+                    self.handle_input(event)
 
             self.update(delta_time)
             self.draw()